@@ -0,0 +1,161 @@
+#! /usr/bin/env python3
+
+''' Micro-benchmark harness for the parsers in this repo.
+
+    Usage: python3 bench.py [-p] [PARSER ...]
+
+    Without arguments, all nine standard parsers are timed on operator
+    chains of growing length: left associative chains '1 + 1 + ... + 1'
+    and right associative chains '1 ^ 1 ^ ... ^ 1' (the binding powers of
+    '+' and '^' are taken from 'binding_powers.json', as usual). Reported
+    is the best wall time per parse (module 'timeit'). PARSER arguments
+    (module names such as 'pcp_rec_0_2') restrict the run.
+
+    With option '-p' and the third-party package 'pyinstrument' installed,
+    each selected parser is additionally profiled on the longest chain and
+    the profile is written in 'speedscope' JSON format (viewable at
+    https://www.speedscope.app/); without 'pyinstrument' the option is
+    ignored with a notice. The harness itself needs the standard library
+    only.
+
+    See PERFORMANCE.md; results from this harness gate which optimization
+    proposals are worth pursuing.
+'''
+
+import contextlib
+import importlib
+import io
+import sys
+import timeit
+
+import helpers as h
+
+# The tokenizer each parser module passes to 'run_parser' (see the last
+# line of each parser module).
+_TOKENIZERS = {
+    "pcp_ir_0": "tokenizer_a",
+    "pcp_ir_0_no_ins": "tokenizer_b",
+    "pcp_it_0_1w": "tokenizer_a",
+    "pcp_it_0_1wg": "tokenizer_e",
+    "pcp_it_0_2w": "tokenizer_a",
+    "pcp_rec_0_0": "tokenizer_a",
+    "pcp_rec_0_1": "tokenizer_c",
+    "pcp_rec_0_2": "tokenizer_d",
+    "pcp_rec_0_3": "tokenizer_d",
+}
+
+_CHAIN_LENGTHS = (10, 100, 1000, 5000)   # Number of operators per chain
+
+
+def _load_parser(name):
+    ''' Import parser module 'name' and return it.
+
+        Importing a parser module runs the test driver once (see the last
+        line of each parser module); 'sys.argv' is staged so that this run
+        parses a trivial expression quietly, and its output is swallowed.
+        The import also makes 'helpers' set up the binding powers.
+    '''
+
+    argv, sys.argv = sys.argv, [name + ".py", "-qq", "x"]
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            return importlib.import_module(name)
+    finally:
+        sys.argv = argv
+
+
+def _best_parse_time(module, tokenizer, code):
+    ''' Best wall time of one 'module.parse(tokenizer, code)' call, in
+        seconds, or None if the call exceeds the recursion limit.
+    '''
+
+    try:
+        timer = timeit.Timer(lambda: module.parse(tokenizer, code))
+        number, _ = timer.autorange()
+        return min(timer.repeat(repeat=3, number=number)) / number
+    except RecursionError:
+        return None
+
+
+class ParseSuite:
+    ''' Timing in a form the 'asv' benchmark runner can pick up; the
+        'track_parse_time' method returns seconds per parse. Also used
+        directly by the command line run below.
+    '''
+
+    params = (sorted(_TOKENIZERS), _CHAIN_LENGTHS, ("+", "^"))
+    param_names = ("parser", "n_oators", "oator")
+    timeout = 120
+
+    def setup(self, parser, n_oators, oator):
+        self.module = _load_parser(parser)
+        self.tokenizer = getattr(h, _TOKENIZERS[parser])
+        self.code = f"1 {oator} " * n_oators + "1"
+
+    def track_parse_time(self, parser, n_oators, oator):
+        return _best_parse_time(self.module, self.tokenizer, self.code)
+
+    track_parse_time.unit = "s"
+
+
+def _profile(module, tokenizer, code, name):
+    ''' Profile one parse with 'pyinstrument', if it is installed, and
+        write the profile in speedscope JSON format.
+    '''
+
+    try:
+        from pyinstrument import Profiler
+        from pyinstrument.renderers import SpeedscopeRenderer
+    except ImportError:
+        print("pyinstrument is not installed; skipping the profile.")
+        return
+    profiler = Profiler()
+    profiler.start()
+    try:
+        module.parse(tokenizer, code)
+    except RecursionError:
+        pass
+    finally:
+        profiler.stop()
+    filename = f"bench_{name}.speedscope.json"
+    with open(filename, "w", encoding="utf-8") as fil:
+        fil.write(profiler.output(SpeedscopeRenderer()))
+    print(f"Profile written to '{filename}'.")
+
+
+def main():
+    ''' Evaluate the command line, time the selected parsers. '''
+
+    # A left associative chain of n operators yields a parse tree of depth
+    # about n, and the recursive helpers (extr_names, the weight checks)
+    # descend it frame by frame; allow the longest chains to be compared.
+    sys.setrecursionlimit(4 * max(_CHAIN_LENGTHS) + 100)
+
+    args = sys.argv[1:]
+    profile = "-p" in args
+    names = [arg for arg in args if arg != "-p"] or sorted(_TOKENIZERS)
+    for name in names:
+        if name not in _TOKENIZERS:
+            print(f"Unknown parser '{name}'. Known parsers:")
+            print(" ".join(sorted(_TOKENIZERS)))
+            sys.exit(1)
+
+    suite = ParseSuite()
+    print(f"{'parser':<16}{'oator':<7}" +
+          "".join(f"{n:>12}" for n in _CHAIN_LENGTHS))
+    for name in names:
+        for oator in ("+", "^"):
+            times = []
+            for n_oators in _CHAIN_LENGTHS:
+                suite.setup(name, n_oators, oator)
+                sec = suite.track_parse_time(name, n_oators, oator)
+                times.append("   rec limit" if sec is None else
+                             f"{sec * 1000:>9.3f} ms")
+            print(f"{name:<16}{oator:<7}" + "".join(times))
+        if profile:
+            suite.setup(name, _CHAIN_LENGTHS[-1], "+")
+            _profile(suite.module, suite.tokenizer, suite.code, name)
+
+
+if __name__ == "__main__":
+    main()
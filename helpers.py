@@ -16,10 +16,9 @@
 
 
 # Imports from standard library. Required items are listed in the comments.
-import sys          # sys.argv, sys.executable
-import math         # math.inf
+import sys          # sys.argv, sys.executable, sys.intern
+import math         # math.inf, math.comb
 import os           # os.path
-import collections  # collections.namedtuple
 import functools    # functools.reduce
 import random       # random.randint
 import json         # json.load
@@ -68,7 +67,23 @@ _OPTIONS = frozenset(_OUTPUTOPTIONS | {"r", "d"})
 
 _AtomicType = (str, int, float)   # To be used in tests (atom or subtree?)
 
-Token = collections.namedtuple("Token", "nam lp rp")  # Used with tokenizer_d.
+class Token:
+    ''' Token object, to be used with tokenizer_d: the token string ('nam')
+        and its left and right binding powers ('lp', 'rp'; None if the token
+        is not an operator).
+
+        This is a plain class with __slots__ rather than a named tuple:
+        reading a slot attribute is a fixed-offset access, while a named
+        tuple resolves every field access through a property descriptor.
+        The parsers using tokenizer_d read 'lp' and 'rp' on every step.
+    '''
+
+    __slots__ = ("nam", "lp", "rp")
+
+    def __init__(self, nam, lp, rp):
+        self.nam = nam
+        self.lp = lp
+        self.rp = rp
 
 LBP = {}   # Define dictionaries LBP, RBP as global variables. Values of LBP,
 RBP = {}   # RBP will be changed in _set_bp, _prepare_command, run_parser.
@@ -106,17 +121,18 @@ def _create_random_ops(n_string):
     for _ in range(n_operators):             # _ is an unused (dummy) variable
         lbp = random.randint(1, min(n_bp, 94)) + 5  # Generated binding powers
         rbp = random.randint(1, min(n_bp, 94)) + 5  # in range 6 to 99.
-        opname = _GEN_OP_L + str(lbp) + _GEN_OP_C + str(rbp) + _GEN_OP_R
+        opname = sys.intern(f"{_GEN_OP_L}{lbp}{_GEN_OP_C}{rbp}{_GEN_OP_R}")
         tlbp[opname] = lbp
         trbp[opname] = rbp
 
-    express = "A0 "
-    oplis = list(tlbp)
+    parts = ["A0"]                 # Collect the tokens in a list; a single
+    oplis = list(tlbp)             # join is cheaper than repeated 'str +='.
+    randint, n_oplis = random.randint, len(oplis)
     for k in range(l_expr):
-        express += (oplis[random.randint(0, len(oplis)-1)] +
-                    " A" + str(k+1) + " ")
+        parts.append(oplis[randint(0, n_oplis-1)])
+        parts.append(f"A{k+1}")
 
-    return True, tlbp, trbp, express[:-1]
+    return True, tlbp, trbp, " ".join(parts)
 
 
 def _create_expr_from_bp(n_string):
@@ -138,7 +154,7 @@ def _create_expr_from_bp(n_string):
         if len(l_r) != 2 or l_r[0] == "_" and l_r[1] == "_":
             print("Invalid option data: '" + op_bp + "'")
             return False, {}, {}, ""
-        opname = _GEN_OP_L + l_r[0] + _GEN_OP_C + l_r[1] + _GEN_OP_R
+        opname = sys.intern(f"{_GEN_OP_L}{l_r[0]}{_GEN_OP_C}{l_r[1]}{_GEN_OP_R}")
         if l_r[0] == "_":
             express = express[:max(0, express.rfind("A")-1)]
         express += " " + opname
@@ -181,21 +197,32 @@ def _tree_to_tlist(tree):
             _tree_to_tlist(tree[1]) + [tree[0]] + _tree_to_tlist(tree[2]))
 
 
-def csx(oator, oand1, oand2=None):
-    ''' Create subexpression from operator and operand(s).
+def _csx_quiet(oator, oand1, oand2=None):
+    ''' Create subexpression from operator and operand(s). '''
 
-        'print_subex_creation' is an attribute of the function 'csx'.
-        The first line below and the return statement are essential. The rest
+    return [oator, oand1] if oand2 is None else [oator, oand1, oand2]
+
+
+def _csx_verbose(oator, oand1, oand2=None):
+    ''' Like _csx_quiet; in addition, print the new subexpression. This
         creates the possibility of better displaying how the parser works.
     '''
 
-    sub = [oator, oand1, oand2] if oand2 else [oator, oand1]
-    if csx.print_subex_creation:
-        print("++ New sub-expr: ", s_expr(extr_names(sub))
-              if isinstance(oator, Token) else s_expr(sub))
+    sub = [oator, oand1] if oand2 is None else [oator, oand1, oand2]
+    print("++ New sub-expr: ", s_expr(extr_names(sub))
+          if isinstance(oator, Token) else s_expr(sub))
     return sub
 
 
+# The parsers create subexpressions by calling 'csx'. It is rebound to
+# _csx_verbose by _prepare_command if one of the options -v, -w is in effect;
+# this way the quiet variant (the normal case) does not test a flag on every
+# call. The attribute 'print_subex_creation' tells the parsers whether the
+# verbose variant is bound (pcp_it_0_1w* then also print their stack).
+csx = _csx_quiet
+csx.print_subex_creation = False
+
+
 def _set_bp():
     ''' Set missing LBP, RBP values for unary operators, $BEGIN and $END. '''
 
@@ -208,13 +235,18 @@ def _set_bp():
 
 
 def _raw_toklist(code):
-    ''' Split the code into tokens; implemented as a 'generator'.'''
+    ''' Split the code into tokens; implemented as a 'generator'.
+
+        Tokens are interned (sys.intern); the parsers use tokens mainly as
+        keys for the LBP, RBP dicts, and lookups with interned keys can be
+        resolved by identity comparison with a cached hash.
+    '''
 
     buf = ""
     for pos, char in enumerate(code):
         if char.isspace():
             if buf:
-                yield buf
+                yield sys.intern(buf)
             buf = ""
         elif not buf:
             buf = char
@@ -225,12 +257,12 @@ def _raw_toklist(code):
                            char == "-" and len(code) > pos+1 and
                            code[pos+1].isdigit())
             if old_is_alnu != new_is_alnu:
-                yield buf
+                yield sys.intern(buf)
                 buf = char
             else:
                 buf += char
     if buf:
-        yield buf
+        yield sys.intern(buf)
 
 
 def tokenizer_e(code):
@@ -294,12 +326,15 @@ def tokenizer_c(code):
 
 def tokenizer_d(code):
     ''' A tokenizer for a functional, recursive parser. Contrary to
-        tokenizer_c, tokens are named tuples (of type "Token"). See above.
+        tokenizer_c, tokens are objects (of type "Token"). See above.
     '''
 
-    toklist = [(Token(tok, LBP[tok], RBP[tok]) if tok in LBP else
-               Token(tok, None, None)) for tok in tokenizer_e(code)]
-    return functools.reduce(lambda x, m: (m, x), reversed(toklist), None)
+    lbp_get, rbp_get = LBP.get, RBP.get  # .get: one dict probe per token
+    toklist = list(tokenizer_e(code))
+    # One Token per distinct token string: repeated operators (and the
+    # virtual '$PRE'/'$POST' operands) share a single, read-only Token.
+    pool = {tok: Token(tok, lbp_get(tok), rbp_get(tok)) for tok in set(toklist)}
+    return functools.reduce(lambda x, m: (pool[m], x), reversed(toklist), None)
 
 
 # Four Functions for singly linked list, similar to car, cadr, caddr, cddr in
@@ -352,22 +387,40 @@ def _top3_weights(tree):
     return twtext + "\n" + _tws(tree[1]) + " "*18 + _tws(tree[2])
 
 
+def _num_bintrees(n_toks):
+    ''' Number of binary trees over n_toks tokens (a Catalan number). '''
+
+    n_oators = n_toks // 2
+    return math.comb(2*n_oators, n_oators) // (n_oators + 1)
+
+
 def _makebintrees(toklis):
-    ''' Create a list of all possible binary trees from a valid token list.
+    ''' Create all possible binary trees from a valid token list.
+
+        Return a 'generator' of triples (tree, ntoks, rootpos), where ntoks
+        is the number of tokens in the tree and rootpos is the number of
+        tokens in the left subtree (None for an atomic tree). The trees are
+        created one by one; materializing all of them at once would require
+        memory for _num_bintrees(len(toklis)) nested lists.
     '''
 
     if not toklis or _isatomic(toklis) or len(toklis) % 2 == 0:
         # This should not happen:
         print("Creation of all parse trees not possible. Invalid argument.")
         return None
+    return _gen_bintrees(toklis)
+
+
+def _gen_bintrees(toklis):
+    ''' Generator behind _makebintrees; toklis is known to be valid here. '''
+
     if len(toklis) == 1:
-        return toklis
-    res = []
+        yield toklis[0], 1, None
+        return
     for k in range(1, len(toklis), 2):
-        res += [[toklis[k], llist, rlist]
-                for llist in _makebintrees(toklis[:k])
-                for rlist in _makebintrees(toklis[k+1:])]
-    return res
+        for ltree, lcount, _ in _gen_bintrees(toklis[:k]):
+            for rtree, rcount, _ in _gen_bintrees(toklis[k+1:]):
+                yield [toklis[k], ltree, rtree], lcount + rcount + 1, lcount
 
 
 def _num_toks_in_tree(tree):
@@ -377,27 +430,26 @@ def _num_toks_in_tree(tree):
             1 + _num_toks_in_tree(tree[1]) + _num_toks_in_tree(tree[2]))
 
 
-def _root_pos(tree):
-    ''' Find position of root operator of tree in the expression. '''
-
-    return None if _isatomic(tree) else _num_toks_in_tree(tree[1])
-
-
 # In _lrange, _rrange: clbp, crbp are "covering" left and right bp.
-# The parameters clbp, crbp enable the recursive definitions
+# Both functions are iterative ('while' loops); Python does not optimize
+# tail recursion, so each recursion step would be a full function call.
 
 def _lrange(toklis, pos, clbp):
     ''' range to the left of operator at position 'pos' (one-based).'''
 
-    return (pos - 1 if pos <= 2 or RBP[toklis[pos-3]] < clbp
-            else _lrange(toklis, pos-2, min(clbp, LBP[toklis[pos-3]])))
+    while pos > 2 and RBP[(tok := toklis[pos-3])] >= clbp:
+        clbp = min(clbp, LBP[tok])
+        pos -= 2
+    return pos - 1
 
 
 def _rrange(toklis, pos, crbp):
     ''' range to the right of operator at position 'pos' (one-based). '''
 
-    return (pos + 1 if pos >= len(toklis)-1 or LBP[toklis[pos+1]] <= crbp
-            else _rrange(toklis, pos+2, min(crbp, RBP[toklis[pos+1]])))
+    while pos < len(toklis)-1 and LBP[(tok := toklis[pos+1])] > crbp:
+        crbp = min(crbp, RBP[tok])
+        pos += 2
+    return pos + 1
 
 
 def _range(toklis, pos):
@@ -426,10 +478,11 @@ def _is_range_correct(toklis, tree, rfrom, rto):
 def _print_ranges(toklis):
     ''' Print ranges of all operators in toklis.'''
 
-    print("\nOperator ranges" if len(toklis) > 1 else "")
+    out = ["\nOperator ranges" if len(toklis) > 1 else ""]
     for pos in range(1, len(toklis), 2):
         lpos, rpos = _range(toklis, pos+1)
-        print(f"{lpos:2} .. {pos+1:2} ({toklis[pos]:3}) .. {rpos:2}")
+        out.append(f"{lpos:2} .. {pos+1:2} ({toklis[pos]:3}) .. {rpos:2}")
+    print("\n".join(out))  # One print for all lines
 
 
 def _check_all_parsings(toklis):
@@ -437,9 +490,9 @@ def _check_all_parsings(toklis):
         toklis, check for correctness. Does not depend on the parse result.
     '''
 
-    if not (all_parse_trees := _makebintrees(toklis)):
+    if (all_parse_trees := _makebintrees(toklis)) is None:
         return
-    if (nppt := len(all_parse_trees)) == 1:
+    if (nppt := _num_bintrees(len(toklis))) == 1:
         print("\nOne possible parse tree. It is weight correct.")
     else:
         print("\nAll " + str(nppt) + " possible parse trees are checked.")
@@ -450,23 +503,22 @@ def _check_all_parsings(toklis):
             print("Exactly one parse result should be weight correct and " +
                   "range correct.\nOther parse results should be " +
                   "neither weight nor range correct.")
-    for tree in all_parse_trees:
+    print_all = len(toklis) <= _MAX_FOR_PRINTED_TREES
+    for tree, _, rootpos in all_parse_trees:
+        # Correctness is determined first; incorrect trees are skipped
+        # before any output formatting (s_expr) is done for them.
         weight_correct = _is_weight_correct(tree)
         range_correct = _is_range_correct(toklis, tree, 1, len(toklis))
-        if (not (weight_correct or range_correct) and
-           len(toklis) > _MAX_FOR_PRINTED_TREES):
+        if not (weight_correct or range_correct or print_all):
             continue
         print(s_expr(tree), " WEIG COR" if weight_correct else " --------",
               end="")
-        if _root_pos(tree):
-            print("  Root pos " + str(_root_pos(tree) + 1), end=" ")
-            cover_lbp = LBP[toklis[_root_pos(tree)]]
-            cover_rbp = RBP[toklis[_root_pos(tree)]]
-            print("range " + str(_lrange(toklis, _root_pos(tree) + 1,
-                                         cover_lbp)) + " ... " +
-                  str(_rrange(toklis, _root_pos(tree) + 1, cover_rbp)),
+        if rootpos:
+            lpos, rpos = _range(toklis, rootpos + 1)
+            print("  Root pos " + str(rootpos + 1), end=" ")
+            print("range " + str(lpos) + " ... " + str(rpos),
                   "RANG COR" if range_correct else "--------")
-        else:              # _root_pos is None if tree is a single atom
+        else:              # rootpos is None if tree is a single atom
             print()
 
 
@@ -553,15 +605,31 @@ def _print_help():
 
 
 def _get_options():
-    ''' Get and prepare command line options. '''
+    ''' Get and prepare command line options.
+
+        Options are collected and classified in one pass over the command
+        line; the validity checks afterwards only use values gathered here.
+    '''
 
     options = set()
     quiet = 0
+    n_outputs = 0
+    has_r = has_d = False
+    invalid = None
 
     k = 1
     while (len(sys.argv) > k and sys.argv[k].startswith("-") and
            sys.argv[k] != "--"):
-        options.add(sys.argv[k][1:])
+        if (option := sys.argv[k][1:]) not in options:
+            options.add(option)
+            if option in _OUTPUTOPTIONS:
+                n_outputs += 1
+            elif option == "r":
+                has_r = True
+            elif option == "d":
+                has_d = True
+            elif invalid is None:
+                invalid = option
         k += 1
 
     n_options = k - 1
@@ -571,16 +639,14 @@ def _get_options():
         print("Specify at most two options. See 'python " +
               sys.argv[0] + " -h'")
         return False, options, 0, 0, False
-    if len(options & _OUTPUTOPTIONS) > 1:    # '&' is intersection of sets
+    if n_outputs > 1:
         print("Use at most one of the output option: " +
               " ".join("-" + opt for opt in sorted(list(_OUTPUTOPTIONS))))
         return False, options, 0, 0, False
-
-    for option in options:
-        if option not in _OPTIONS:
-            print("Invalid option: '-" + option + "'")
-            return False, options, 0, 0, False
-    if "d" in options and "r" in options:
+    if invalid is not None:
+        print("Invalid option: '-" + invalid + "'")
+        return False, options, 0, 0, False
+    if has_r and has_d:
         print("Use at most one of options -r, -d.")
         return False, options, 0, 0, False
     if "v" in options or "w" in options:
@@ -597,9 +663,12 @@ def _get_options():
 def _prepare_command():
     ''' Prepare command line arguments for 'run_parser'.
 
-        Caution: Values of global dicts LBP, RBP can be changed here.
+        Caution: Values of global dicts LBP, RBP can be changed here;
+        the global name 'csx' can be rebound here.
     '''
 
+    global csx
+
     valid = True
     random_or_cl_defined = False   # option -r or -d in effect?
 
@@ -607,7 +676,8 @@ def _prepare_command():
     if not options_valid:
         return False, "", quiet, False, False
 
-    csx.print_subex_creation = (quiet < 0)  # Create a function attribute.
+    csx = _csx_verbose if quiet < 0 else _csx_quiet  # Select csx variant.
+    csx.print_subex_creation = (quiet < 0)
     if "r" in options:
         random_or_cl_defined = True
         if quiet < 1:
@@ -648,11 +718,8 @@ def _print_result(res, res1, quiet, code, upsidedown):
         code       --  Original code to be parsed.
         upsidedown --  Boolean: If True print parse tree upside down
     '''
-    toklist = []
-    toks = tokenizer_a(code)
-    while toks() != "$END":
-        toklist.append(toks(1))
-    toklist.pop()  # Now toklist includes virtual tokens, but not $BEGIN, $END
+    # toklist includes virtual tokens, but not $BEGIN, $END
+    toklist = list(tokenizer_e(code))[1:-1]
 
     # pc_ok: Result of check with virtual operands
     pc_ok = _is_weight_correct(res1) and _tree_to_tlist(res1) == toklist
@@ -725,8 +792,9 @@ def run_parser(parsefun, tokenizer, fake_tokens_inserted=True):
                   _BP_JSON_FILENAME, "r", encoding="utf-8") as bp_jsonfile:
             bp_dict = json.load(bp_jsonfile)  # binding powers from JSON file
 
-        LBP.update(bp_dict["LBP"])       # Set values of global LBP, RBP
-        RBP.update(bp_dict["RBP"])
+        # Set values of global LBP, RBP; keys are interned (see _raw_toklist)
+        LBP.update({sys.intern(k): v for k, v in bp_dict["LBP"].items()})
+        RBP.update({sys.intern(k): v for k, v in bp_dict["RBP"].items()})
 
     # 'non_infix_ops' must be generated before calling parsefun.
     non_infix_ops = {"pre": {k for k in RBP if k not in LBP},
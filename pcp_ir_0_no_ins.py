@@ -13,19 +13,20 @@ import helpers as h  # Use LBP, RBP, tokenizer_b, run_parser, csx.
 def parse_expr(toks, min_rbp=0):
     ''' Precedence climbing parser; iterative and recursive parsing. '''
 
+    lbp, rbp, csx = h.LBP, h.RBP, h.csx  # Locals: cheaper in the hot loop
     ctok = toks(1)
-    if h.LBP.get(ctok) == 100:   # is ctok a prefix op?
-        sub = h.csx(ctok, parse_expr(toks, h.RBP[ctok]))
+    if lbp.get(ctok) == 100:   # is ctok a prefix op?
+        sub = csx(ctok, parse_expr(toks, rbp[ctok]))
     else:
         toks(1)
         sub = ctok
-    while min_rbp < h.LBP[toks()]:
+    while min_rbp < lbp[toks()]:
         oator = toks()
-        if h.RBP[oator] == 100:  # is oator a postfix op?
-            sub = h.csx(oator, sub)
+        if rbp[oator] == 100:  # is oator a postfix op?
+            sub = csx(oator, sub)
             toks(1)
         else:
-            sub = h.csx(oator, sub, parse_expr(toks, h.RBP[toks()]))
+            sub = csx(oator, sub, parse_expr(toks, rbp[toks()]))
     return sub
 
 
@@ -11,22 +11,30 @@ import helpers as h  # Use LBP, RBP, s_expr, csx, tokenizer_a, run_parser
 def parse_expr(toks):
     ''' Iterative parser with one 'while' loop and one stack. '''
 
+    lbp, rbp, csx = h.LBP, h.RBP, h.csx    # Locals: cheaper in the hot loop
     oo_stack = [toks(), toks(1)]
     oator = toks(1)
 
-    if h.csx.print_subex_creation:                      # Not needed for
+    if csx.print_subex_creation:                        # Not needed for
         print("stack: " + h.s_expr(oo_stack))           # the actual parsing
-    while len(oo_stack) > 2 or h.LBP[oator] >= 0:
-        if h.RBP[oo_stack[-2]] >= h.LBP[oator]:         # "Reduce"
+
+    # The sentinels make an extra stack-size test unnecessary: '$BEGIN' has
+    # rbp -2, so the reduce test fails at the bottom of the stack, and
+    # '$END' has lbp -1, so neither test succeeds exactly when the stack is
+    # reduced to '$BEGIN' and the result and all input is consumed.
+    while True:
+        if rbp[oo_stack[-2]] >= lbp[oator]:             # "Reduce"
             right = oo_stack.pop()
-            oo_stack.append(h.csx(oo_stack.pop(), oo_stack.pop(), right))
-            if h.csx.print_subex_creation:              # Not needed for
+            oo_stack.append(csx(oo_stack.pop(), oo_stack.pop(), right))
+            if csx.print_subex_creation:                # Not needed for
                 print("reduced " + h.s_expr(oo_stack))  # the actual parsing
-        else:                                           # "Shift"
+        elif lbp[oator] >= 0:                           # "Shift"
             oo_stack += [oator, toks(1)]
             oator = toks(1)
-            if h.csx.print_subex_creation:              # Not needed for
+            if csx.print_subex_creation:                # Not needed for
                 print("shifted " + h.s_expr(oo_stack))  # the actual parsing
+        else:
+            break
 
     return oo_stack[1]   # oo_stack[0] is the '$BEGIN' token
 
@@ -13,18 +13,23 @@ import helpers as h  # Use LBP, RBP, csx, tokenizer_e, run_parser
 def parse_expr(token):
     ''' Precedence climbing, iterative parsing with one 'while' loop. '''
 
+    lbp, rbp, csx = h.LBP, h.RBP, h.csx  # Locals: cheaper in the hot loop
     oo_stack = [next(token), next(token)]          # '$BEGIN', first operand
     oator = next(token)
-    if h.csx.print_subex_creation:                 # Not required for the
+    if csx.print_subex_creation:                   # Not required for the
         print("stack: " + h.s_expr(oo_stack))      # actual parsing
-    while len(oo_stack) > 2 or h.LBP[oator] >= 0:
-        if h.RBP[oo_stack[-2]] >= h.LBP[oator]:    # "Reduce" step
+    # See pcp_it_0_1w: the sentinel binding powers of '$BEGIN' (rbp -2) and
+    # '$END' (lbp -1) make an extra stack-size test unnecessary.
+    while True:
+        if rbp[oo_stack[-2]] >= lbp[oator]:        # "Reduce" step
             right = oo_stack.pop()
-            oo_stack.append(h.csx(oo_stack.pop(), oo_stack.pop(), right))
-        else:                                      # "Shift" step
+            oo_stack.append(csx(oo_stack.pop(), oo_stack.pop(), right))
+        elif lbp[oator] >= 0:                      # "Shift" step
             oo_stack += [oator, next(token)]
             oator = next(token)
-        if h.csx.print_subex_creation:             # This is not required for
+        else:
+            break
+        if csx.print_subex_creation:               # This is not required for
             print("stack: " + h.s_expr(oo_stack))  # the actual parsing.
 
     return oo_stack[1]   # oo_stack[0] is the '$BEGIN' token
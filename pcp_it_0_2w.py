@@ -11,15 +11,16 @@ def parse_expr(toks):
         'while' loops, an operand stack and an operator stack.
     '''
 
+    lbp, rbp, csx = h.LBP, h.RBP, h.csx  # Locals: cheaper in the hot loops
     orand_stack, oator_stack = [], []  # Python lists, used as stacks
     oator = "$BEGIN"
-    while h.LBP[oator] >= 0:
+    while lbp[oator] >= 0:
         orand_stack.append(toks(1))                     # Shift step
         oator_stack.append(oator)
         oator = toks(1)
-        while h.RBP[oator_stack[-1]] >= h.LBP[oator]:   # "Reduce" steps
+        while rbp[oator_stack[-1]] >= lbp[oator]:       # "Reduce" steps
             right, left = orand_stack.pop(), orand_stack.pop()
-            orand_stack.append(h.csx(oator_stack.pop(), left, right))
+            orand_stack.append(csx(oator_stack.pop(), left, right))
 
     # orand_stack should contain the result now, i.e., exactly one element
     return orand_stack[0]
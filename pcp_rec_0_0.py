@@ -1,18 +1,31 @@
 #! /usr/bin/env python3
 
-''' Simple precedence climbing parser. Parsing is recursive. '''
+''' Simple precedence climbing parser. Parsing is recursive.
+
+    Only the descent into subexpressions with higher binding power is a
+    real recursion. The tail-recursive part (parsing the operators that
+    follow at the same level) is implemented by a 'while' loop; Python
+    does not optimize tail calls, so the former tail recursion paid one
+    function frame per operator and could hit the recursion limit on
+    long expressions.
+'''
 
 import helpers as h  # Use LBP, RBP, csx, tokenizer_a, run_parser.
 
 
 def parse_expr_rec(toks, sub, min_rbp=0):
-    ''' Precedence climbing parser; recursive parsing, without loops. '''
+    ''' Precedence climbing parser; recursion for subexpressions with
+        higher binding power, a 'while' loop instead of tail recursion.
+    '''
 
-    oator, sub1 = toks(), toks(1)
-    if h.RBP[oator] < h.LBP[toks(1)]:
-        sub1 = parse_expr_rec(toks, sub1, h.RBP[oator])
-    return (h.csx(oator, sub, sub1) if min_rbp >= h.LBP[toks()] else
-            parse_expr_rec(toks, h.csx(oator, sub, sub1), min_rbp))
+    lbp, rbp, csx = h.LBP, h.RBP, h.csx  # Locals: cheaper than h.* lookups
+    while True:
+        oator, sub1 = toks(), toks(1)
+        if rbp[oator] < lbp[toks(1)]:
+            sub1 = parse_expr_rec(toks, sub1, rbp[oator])
+        sub = csx(oator, sub, sub1)
+        if min_rbp >= lbp[toks()]:
+            return sub
 
 
 def parse_expr(toks):
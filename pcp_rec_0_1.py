@@ -1,11 +1,15 @@
 #! /usr/bin/env python3
 
-''' Simple precedence climbing parser. Parsing is recursive (no loops).
+''' Simple precedence climbing parser. Parsing is recursive.
 
     This is an attempt to create a functional recursive parser in Python. The
     dictionaries LBP and RBP (binding powers) are global which violates strict
     functional rules. The implementation is not 'pythonic' because Python does
     not promote functional programming (lambda expression, reduce, ...).
+    For the same reason, the tail-recursive part of 'parse_expr' is written
+    as a 'while' loop: Python does not optimize tail calls, so the pure
+    version paid one function frame per operator and could hit the recursion
+    limit on long expressions.
 '''
 
 # Use LBP, RBP, tokenizer_c, first, second, third, rrest, csx,
@@ -14,14 +18,19 @@ import helpers as h
 
 
 def parse_expr(tol, sub, min_rbp=0):
-    '''Precedence climbing parser; recursive, functional parsing. '''
-
-    oator, sub1, tokm = (h.first(tol), h.second(tol), h.rrest(tol))
-    tokn, subn = (parse_expr(tokm, sub1, h.RBP[oator]) if
-                  h.RBP[oator] < h.LBP[h.third(tol)] else (tokm, sub1))
-    return ((tokn, h.csx(oator, sub, subn))
-            if min_rbp >= h.LBP[h.first(tokn)]
-            else parse_expr(tokn, h.csx(oator, sub, subn), min_rbp))
+    '''Precedence climbing parser; recursive, functional parsing. The
+       former tail recursion is a 'while' loop (see module docstring).
+    '''
+
+    lbp, rbp, csx = h.LBP, h.RBP, h.csx  # Locals: cheaper than h.* lookups
+    while True:
+        oator, sub1, tokm = (h.first(tol), h.second(tol), h.rrest(tol))
+        tokn, subn = (parse_expr(tokm, sub1, rbp[oator]) if
+                      rbp[oator] < lbp[h.third(tol)] else (tokm, sub1))
+        sub = csx(oator, sub, subn)
+        if min_rbp >= lbp[h.first(tokn)]:
+            return tokn, sub
+        tol = tokn
 
 
 def parse(tokenizer, code):
@@ -2,9 +2,9 @@
 
 ''' Precedence climbing parser; recursive, functional parsing.
 
-    Contrary to most other parsers in this repo, a 'token' is here a named
-    tuple, consisting of the actual token (string or number) and, in case the
-    token is an operator, the binding powers. See definition ot 'Token' in
+    Contrary to most other parsers in this repo, a 'token' is here a small
+    object, consisting of the actual token (string or number) and, in case
+    the token is an operator, the binding powers. See definition ot 'Token' in
     'helpers.py'. This makes a purely functional implementation possible.
     However, the implementation is not 'pythonic', because Python does not
     promote functional programming (lambda expression, reduce, ...).
@@ -15,12 +15,26 @@ import helpers as h
 
 
 def parse_expr(tol, sub, min_rbp):
-    ''' Precedence climbing parser; recursive, functional parsing. '''
-
-    if min_rbp >= h.first(tol).lp:  # This could be checked by the caller.
-        return (tol, sub)           # This could be done by the caller.
-    tol1, sub1 = parse_expr(h.rrest(tol), h.second(tol), h.first(tol).rp)
-    return parse_expr(tol1, h.csx(h.first(tol), sub, sub1), min_rbp)
+    ''' Precedence climbing parser; recursive, functional parsing. The
+        former tail recursion is a 'while' loop; Python does not optimize
+        tail calls, so the pure version paid one function frame per
+        operator and could hit the recursion limit on long expressions.
+    '''
+
+    # The accessors h.first, h.second, h.rrest are inlined as subscripts
+    # here; each call was a full Python function call around one subscript.
+    # The third element of the result is the first token of the returned
+    # token list (the operator the caller continues with), so the caller
+    # does not have to read tol[0] again after each recursive call.
+    csx = h.csx
+    tok = tol[0]
+    while True:
+        if min_rbp >= tok.lp:
+            return (tol, sub, tok)
+        rest = tol[1]    # rest[0] is h.second(tol), rest[1] is h.rrest(tol)
+        tol, sub1, ntok = parse_expr(rest[1], rest[0], tok.rp)
+        sub = csx(tok, sub, sub1)
+        tok = ntok
 
 
 def parse(tokenizer, code):
@@ -1,8 +1,8 @@
 #! /usr/bin/env python3
 
-''' Contrary to most other parsers in this repo, a 'token' is here a named
-    tuple, consisting of the actual token (string or number) and, in case the
-    token is an operator, the binding powers. See definition ot 'Token' in
+''' Contrary to most other parsers in this repo, a 'token' is here a small
+    object, consisting of the actual token (string or number) and, in case
+    the token is an operator, the binding powers. See definition ot 'Token' in
     'helpers.py'. This makes a purely functional implementation possible. The
     implementation is not 'pythonic' because Python does not promote
     functional programming (lambda expression, reduce, ...).
@@ -13,15 +13,33 @@ import helpers as h
 
 
 def parse_expr(tol, sub, min_rbp):
-    ''' Precedence climbing parser; recursive, functional parsing. '''
-
-    # Compare with parse_expr from pcp_rec_0_2.
-    tom, suc = ((h.rrest(tol), h.second(tol)) if
-                h.first(tol).rp >= h.third(tol).lp else
-                parse_expr(h.rrest(tol), h.second(tol), h.first(tol).rp))
-    return ((tom, h.csx(h.first(tol), sub, suc))
-            if min_rbp >= h.first(tom).lp
-            else parse_expr(tom, h.csx(h.first(tol), sub, suc), min_rbp))
+    ''' Precedence climbing parser; recursive, functional parsing. The
+        former tail recursion is a 'while' loop; Python does not optimize
+        tail calls, so the pure version paid one function frame per
+        operator and could hit the recursion limit on long expressions.
+    '''
+
+    # Compare with parse_expr from pcp_rec_0_2. - The accessors h.first,
+    # h.second, h.third, h.rrest are inlined as subscripts here, and the
+    # repeated subexpressions (tol[0], rest[1], tom[0]) are each evaluated
+    # once and kept in local names ('tok', 'tom', 'ntok'). The third
+    # element of the result is the first token of the returned token list,
+    # so the caller does not have to read tom[0] again after a recursion.
+    csx = h.csx
+    tok = tol[0]
+    while True:
+        rest = tol[1]    # rest[0] is h.second(tol), rest[1] is h.rrest(tol)
+        tom = rest[1]
+        ntok = tom[0]
+        if tok.rp >= ntok.lp:
+            suc = rest[0]
+        else:
+            tom, suc, ntok = parse_expr(tom, rest[0], tok.rp)
+        sub = csx(tok, sub, suc)
+        if min_rbp >= ntok.lp:
+            return (tom, sub, ntok)
+        tok = ntok
+        tol = tom
 
 
 def parse(tokenizer, code):